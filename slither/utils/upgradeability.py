@@ -1,4 +1,11 @@
-from typing import Optional, Tuple, List, Union
+import multiprocessing
+import os
+import re
+import sys
+from collections import deque
+from typing import Optional, Tuple, List, Union, Dict, Callable, Any
+from weakref import WeakKeyDictionary, ReferenceType, ref
+
 from slither.core.declarations import (
     Contract,
     Structure,
@@ -60,6 +67,41 @@ from slither.slithir.variables import (
 )
 from slither.tools.read_storage.read_storage import SlotInfo, SlitherReadStorage
 
+# Captures an sload's argument up to the next parenthesis, e.g. `0x...` in `sload(0x...)`
+_SLOAD_ARG_RE = re.compile(r"sload\(([^()]*)")
+
+# Captures the name and the slot in an assembly assignment such as `impl := sload(0x...)`
+_ASM_SLOAD_ASSIGNMENT_RE = re.compile(r"(\w+)\s*:=\s*sload\(([^)]*)")
+
+# The encoding of an IR never changes once the analysis is done, so it is computed once per IR.
+# Weak keys keep the cache from outliving the Slither object that owns the IRs.
+_IR_ENCODE_CACHE: "WeakKeyDictionary[Operation, str]" = WeakKeyDictionary()
+
+# Verdicts of is_function_modified per pair of functions whose content hashes differ.
+# They are not keyed on the hashes themselves: the IR of a function also depends on declarations
+# outside of its source (e.g., the types of the state variables it uses) and on SlithIR numbering.
+_FUNCTION_MODIFIED_CACHE: "WeakKeyDictionary[Function, WeakKeyDictionary[Function, bool]]" = (
+    WeakKeyDictionary()
+)
+
+# Resolving a proxy's implementation walks its fallback and computes data dependencies and storage layouts,
+# so the results are kept per Contract for every printer/detector/tool asking for them.
+_PROXY_VAR_CACHE: "WeakKeyDictionary[Contract, Optional[Variable]]" = WeakKeyDictionary()
+_PROXY_SLOT_CACHE: "WeakKeyDictionary[Contract, Optional[SlotInfo]]" = WeakKeyDictionary()
+# find_delegate_from_name may be called with several names for the same function,
+# so the sload assignments in its assembly are only parsed once.
+_ASM_SLOAD_SLOTS_CACHE: "WeakKeyDictionary[Function, Dict[str, str]]" = WeakKeyDictionary()
+# compare and get_missing_vars (which compare calls) both filter the same contracts' state variables
+_STORED_STATE_VARIABLES_CACHE: "WeakKeyDictionary[Contract, List[StateVariable]]" = (
+    WeakKeyDictionary()
+)
+_STATE_VARIABLES_BY_SLOT_CACHE: "WeakKeyDictionary[Contract, Dict[int, StateVariable]]" = (
+    WeakKeyDictionary()
+)
+
+# Pairs given to compare_many, inherited by its forked workers
+_COMPARE_MANY_PAIRS: List[Tuple[Contract, Contract]] = []
+
 
 # pylint: disable=too-many-locals
 def compare(
@@ -84,14 +126,10 @@ def compare(
         tainted-functions: list[Function]
     """
 
-    order_vars1 = [
-        v for v in v1.state_variables_ordered if not v.is_constant and not v.is_immutable
-    ]
-    order_vars2 = [
-        v for v in v2.state_variables_ordered if not v.is_constant and not v.is_immutable
-    ]
-    func_sigs1 = [function.solidity_signature for function in v1.functions]
-    func_sigs2 = [function.solidity_signature for function in v2.functions]
+    order_vars1 = _get_stored_state_variables(v1)
+    order_vars2 = _get_stored_state_variables(v2)
+    funcs1 = _functions_by_signature(v1)
+    funcs2 = _functions_by_signature(v2)
 
     missing_vars_in_v2 = []
     new_variables = []
@@ -107,10 +145,9 @@ def compare(
     # Find all new and modified functions in the v2 contract
     new_modified_functions = []
     new_modified_function_vars = []
-    for sig in func_sigs2:
-        function = v2.get_function_from_signature(sig)
-        orig_function = v1.get_function_from_signature(sig)
-        if sig not in func_sigs1:
+    for sig, function in funcs2.items():
+        orig_function = funcs1.get(sig)
+        if orig_function is None:
             new_modified_functions.append(function)
             new_functions.append(function)
             new_modified_function_vars += (
@@ -127,36 +164,34 @@ def compare(
 
     # Find all unmodified functions that call a modified function or read/write the
     # same state variable(s) as a new/modified function, i.e., tainted functions
+    new_modified_functions_set = set(new_modified_functions)
+    new_modified_vars_set = {
+        var for var in new_modified_function_vars if not var.is_constant and not var.is_immutable
+    }
     for function in v2.functions:
         if (
-            function in new_modified_functions
+            function in new_modified_functions_set
             or function.is_constructor
-            or function.name.startswith("slither")
+            or function.is_constructor_variables
         ):
             continue
-        modified_calls = [
-            func for func in new_modified_functions if func in function.internal_calls
-        ]
-        tainted_vars = [
-            var
-            for var in set(new_modified_function_vars)
-            if var in function.variables_read_or_written
-            and not var.is_constant
-            and not var.is_immutable
-        ]
-        if len(modified_calls) > 0 or len(tainted_vars) > 0:
+        if not (
+            new_modified_functions_set.isdisjoint(function.internal_calls)
+            and new_modified_vars_set.isdisjoint(function.variables_read_or_written)
+        ):
             tainted_functions.append(function)
 
     # Find all new or tainted variables, i.e., variables that are read or written by a new/modified/tainted function
+    v1_var_names = {var.name for var in v1.state_variables}
+    # The new/modified/tainted functions are all v2 functions, so a variable is in this set exactly when
+    # v2.get_functions_reading_from_variable/writing_to_variable would return one of them
+    new_modified_tainted_vars = set()
+    for func in new_modified_functions + tainted_functions:
+        new_modified_tainted_vars.update(func.variables_read_or_written)
     for var in order_vars2:
-        read_by = v2.get_functions_reading_from_variable(var)
-        written_by = v2.get_functions_writing_to_variable(var)
-        if v1.get_state_variable_from_name(var.name) is None:
+        if var.name not in v1_var_names:
             new_variables.append(var)
-        elif any(
-            func in read_by or func in written_by
-            for func in new_modified_functions + tainted_functions
-        ):
+        elif var in new_modified_tainted_vars:
             tainted_variables.append(var)
 
     return (
@@ -169,6 +204,101 @@ def compare(
     )
 
 
+def compare_many(
+    pairs: List[Tuple[Contract, Contract]], processes: Optional[int] = None
+) -> List[
+    Tuple[
+        List[Variable],
+        List[Variable],
+        List[Variable],
+        List[Function],
+        List[Function],
+        List[Function],
+    ]
+]:
+    """
+    Compares several pairs of contract versions, spreading the pairs over worker processes.
+    Contracts cannot be pickled, so the workers are forked to inherit them and only send back the positions
+    of the results, which are mapped back to the caller's objects. Falls back to calling compare on each pair
+    in turn when fork is not available (e.g., on Windows) or not safe (on macOS), or when a single worker would run.
+
+    Args:
+        pairs: List of (v1, v2) contract pairs, see compare
+        processes: Number of worker processes, defaults to the number of CPUs (at most one per pair)
+
+    Returns:
+        List of compare results, in the same order as pairs
+    """
+    processes = min(processes or os.cpu_count() or 1, len(pairs))
+    # Forking is not safe on macOS, where system frameworks may crash the child (spawn is the default there)
+    if (
+        processes < 2
+        or sys.platform == "darwin"
+        or "fork" not in multiprocessing.get_all_start_methods()
+    ):
+        return [compare(v1, v2) for v1, v2 in pairs]
+    with multiprocessing.get_context("fork").Pool(
+        processes, initializer=_init_compare_worker, initargs=(pairs,)
+    ) as pool:
+        positions = pool.map(_compare_positions, range(len(pairs)))
+    results = []
+    for (v1, v2), pair_positions in zip(pairs, positions):
+        missing, new_vars, tainted_vars, new_funcs, modified_funcs, tainted_funcs = pair_positions
+        vars1 = _get_stored_state_variables(v1)
+        vars2 = _get_stored_state_variables(v2)
+        functions2 = v2.functions
+        results.append(
+            (
+                [vars1[i] for i in missing],
+                [vars2[i] for i in new_vars],
+                [vars2[i] for i in tainted_vars],
+                [functions2[i] for i in new_funcs],
+                [functions2[i] for i in modified_funcs],
+                [functions2[i] for i in tainted_funcs],
+            )
+        )
+    return results
+
+
+def _init_compare_worker(pairs: List[Tuple[Contract, Contract]]) -> None:
+    _COMPARE_MANY_PAIRS[:] = pairs
+
+
+def _compare_positions(index: int) -> List[List[int]]:
+    v1, v2 = _COMPARE_MANY_PAIRS[index]
+    missing, new_vars, tainted_vars, new_funcs, modified_funcs, tainted_funcs = compare(v1, v2)
+    vars1 = {v: i for i, v in enumerate(_get_stored_state_variables(v1))}
+    vars2 = {v: i for i, v in enumerate(_get_stored_state_variables(v2))}
+    functions2 = {f: i for i, f in enumerate(v2.functions)}
+    return [
+        [vars1[v] for v in missing],
+        [vars2[v] for v in new_vars],
+        [vars2[v] for v in tainted_vars],
+        [functions2[f] for f in new_funcs],
+        [functions2[f] for f in modified_funcs],
+        [functions2[f] for f in tainted_funcs],
+    ]
+
+
+def _functions_by_signature(contract: Contract) -> Dict[str, Function]:
+    """
+    Maps each solidity signature to the function Contract.get_function_from_signature would return for it
+    Args:
+        contract: The Contract object
+
+    Returns:
+        Dict mapping solidity signatures to non-shadowed Functions
+    """
+    functions: Dict[str, Function] = {}
+    for function in contract.functions:
+        sig = function.solidity_signature
+        current = functions.get(sig)
+        # Keep the key at its first occurrence, but prefer the first non-shadowed function
+        if current is None or (current.is_shadowed and not function.is_shadowed):
+            functions[sig] = function
+    return functions
+
+
 def get_missing_vars(v1: Contract, v2: Contract) -> List[StateVariable]:
     """
     Gets all non-constant/immutable StateVariables that appear in v1 but not v2
@@ -179,18 +309,29 @@ def get_missing_vars(v1: Contract, v2: Contract) -> List[StateVariable]:
     Returns:
         List of StateVariables from v1 missing in v2
     """
-    results = []
-    order_vars1 = [
-        v for v in v1.state_variables_ordered if not v.is_constant and not v.is_immutable
-    ]
-    order_vars2 = [
-        v for v in v2.state_variables_ordered if not v.is_constant and not v.is_immutable
-    ]
-    if len(order_vars2) < len(order_vars1):
-        for variable in order_vars1:
-            if variable.name not in [v.name for v in order_vars2]:
-                results.append(variable)
-    return results
+    order_vars1 = _get_stored_state_variables(v1)
+    order_vars2 = _get_stored_state_variables(v2)
+    if len(order_vars2) >= len(order_vars1):
+        return []
+    names2 = {v.name for v in order_vars2}
+    return [variable for variable in order_vars1 if variable.name not in names2]
+
+
+def _get_stored_state_variables(contract: Contract) -> List[StateVariable]:
+    """
+    Gets the contract's non-constant/immutable StateVariables, in storage order.
+    The result is cached per contract and must not be modified.
+    Args:
+        contract: The Contract object
+
+    Returns:
+        List of StateVariables stored in the contract's storage
+    """
+    if contract not in _STORED_STATE_VARIABLES_CACHE:
+        _STORED_STATE_VARIABLES_CACHE[contract] = [
+            v for v in contract.state_variables_ordered if not v.is_constant and not v.is_immutable
+        ]
+    return _STORED_STATE_VARIABLES_CACHE[contract]
 
 
 def is_function_modified(f1: Function, f2: Function) -> bool:
@@ -209,50 +350,105 @@ def is_function_modified(f1: Function, f2: Function) -> bool:
     # If the function content hashes are the same, no need to investigate the function further
     if f1.source_mapping.content_hash == f2.source_mapping.content_hash:
         return False
+    verdicts = _FUNCTION_MODIFIED_CACHE.setdefault(f1, WeakKeyDictionary())
+    if f2 not in verdicts:
+        verdicts[f2] = _is_function_modified(f1, f2)
+    return verdicts[f2]
+
+
+def _is_function_modified(f1: Function, f2: Function) -> bool:
     # If the hashes differ, it is possible a change in a name or in a comment could be the only difference
     # So we need to resort to walking through the CFG and comparing the IR operations
-    queue_f1 = [f1.entry_point]
-    queue_f2 = [f2.entry_point]
-    visited = []
+    # CFGs of different sizes cannot match, whatever the IRs are
+    if len(f1.nodes) != len(f2.nodes):
+        return True
+    # Functions without a body (e.g., in an interface) have no CFG to walk
+    if f1.entry_point is None or f2.entry_point is None:
+        return (f1.entry_point is None) != (f2.entry_point is None)
+    queue_f1 = deque([f1.entry_point])
+    queue_f2 = deque([f2.entry_point])
+    visited = set()
     while len(queue_f1) > 0 and len(queue_f2) > 0:
-        node_f1 = queue_f1.pop(0)
-        node_f2 = queue_f2.pop(0)
-        visited.extend([node_f1, node_f2])
+        node_f1 = queue_f1.popleft()
+        node_f2 = queue_f2.popleft()
+        visited.add(node_f1)
+        visited.add(node_f2)
         queue_f1.extend(son for son in node_f1.sons if son not in visited)
         queue_f2.extend(son for son in node_f2.sons if son not in visited)
-        for i, ir in enumerate(node_f1.irs):
-            if encode_ir_for_compare(ir) != encode_ir_for_compare(node_f2.irs[i]):
+        if len(queue_f1) != len(queue_f2) or len(node_f1.irs) != len(node_f2.irs):
+            return True
+        for ir_f1, ir_f2 in zip(node_f1.irs, node_f2.irs):
+            if encode_ir_for_compare(ir_f1) != encode_ir_for_compare(ir_f2):
                 return True
     return False
 
 
-# pylint: disable=too-many-branches
+def _encode_default(_: Any) -> str:
+    return ""
+
+
+def _find_encoder(
+    cls: type,
+    encoders: List[Tuple[type, Callable[[Any], str]]],
+    default: Callable[[Any], str] = _encode_default,
+) -> Callable[[Any], str]:
+    return next((encoder for base, encoder in encoders if issubclass(cls, base)), default)
+
+
+def _ntype_user_defined(_type: UserDefinedType) -> str:
+    if isinstance(_type.type, Contract):
+        return f"contract({_type.type.name})"
+    if isinstance(_type.type, Structure):
+        return f"struct({_type.type.name})"
+    if isinstance(_type.type, Enum):
+        return f"enum({_type.type.name})"
+    return str(_type)
+
+
+# Checked in order, like an isinstance chain: the first matching class wins
+_NTYPE_ENCODERS: List[Tuple[type, Callable[[Any], str]]] = [
+    (ElementaryType, str),
+    (
+        ArrayType,
+        lambda t: str(t) if isinstance(t.type, ElementaryType) else "user_defined_array",
+    ),
+    (Structure, str),
+    (Enum, str),
+    (MappingType, str),
+    (UserDefinedType, _ntype_user_defined),
+]
+_NTYPE_ENCODERS_BY_TYPE: Dict[type, Callable[[Any], str]] = {}
+
+# Keyed on id() since types compare and hash by value, which is as costly as ntype itself.
+# The weak reference guards against a recycled id, and its callback drops the entry with the type.
+_NTYPE_CACHE: Dict[int, Tuple["ReferenceType[Any]", str]] = {}
+
+
 def ntype(_type: Union[Type, str]) -> str:
-    if isinstance(_type, ElementaryType):
-        _type = str(_type)
-    elif isinstance(_type, ArrayType):
-        if isinstance(_type.type, ElementaryType):
-            _type = str(_type)
-        else:
-            _type = "user_defined_array"
-    elif isinstance(_type, Structure):
-        _type = str(_type)
-    elif isinstance(_type, Enum):
-        _type = str(_type)
-    elif isinstance(_type, MappingType):
-        _type = str(_type)
-    elif isinstance(_type, UserDefinedType):
-        if isinstance(_type.type, Contract):
-            _type = f"contract({_type.type.name})"
-        elif isinstance(_type.type, Structure):
-            _type = f"struct({_type.type.name})"
-        elif isinstance(_type.type, Enum):
-            _type = f"enum({_type.type.name})"
-    else:
-        _type = str(_type)
-
-    _type = _type.replace(" memory", "")
-    _type = _type.replace(" storage ref", "")
+    if isinstance(_type, str):
+        return _normalize_type(_type)
+    key = id(_type)
+    cached = _NTYPE_CACHE.get(key)
+    if cached is not None and cached[0]() is _type:
+        return cached[1]
+    encoder = _NTYPE_ENCODERS_BY_TYPE.get(type(_type))
+    if encoder is None:
+        encoder = _find_encoder(type(_type), _NTYPE_ENCODERS, default=str)
+        _NTYPE_ENCODERS_BY_TYPE[type(_type)] = encoder
+    result = sys.intern(_normalize_type(encoder(_type)))
+    try:
+        _NTYPE_CACHE[key] = (ref(_type, lambda _, key=key: _NTYPE_CACHE.pop(key, None)), result)
+    except TypeError:
+        # Not weakly referenceable (e.g. a list of types for a tuple), so it is not cached
+        pass
+    return result
+
+
+def _normalize_type(_type: str) -> str:
+    # Most types, e.g. elementary ones, have no data location to strip
+    if " " in _type:
+        _type = _type.replace(" memory", "")
+        _type = _type.replace(" storage ref", "")
 
     if "struct" in _type:
         return "struct"
@@ -267,89 +463,84 @@ def ntype(_type: Union[Type, str]) -> str:
     return _type.replace(" ", "_")
 
 
-# pylint: disable=too-many-branches
 def encode_ir_for_compare(ir: Operation) -> str:
-    # operations
-    if isinstance(ir, Assignment):
-        return f"({encode_var_for_compare(ir.lvalue)}):=({encode_var_for_compare(ir.rvalue)})"
-    if isinstance(ir, Index):
-        return f"index({ntype(ir.index_type)})"
-    if isinstance(ir, Member):
-        return "member"  # .format(ntype(ir._type))
-    if isinstance(ir, Length):
-        return "length"
-    if isinstance(ir, Binary):
-        return f"binary({str(ir.variable_left)}{str(ir.type)}{str(ir.variable_right)})"
-    if isinstance(ir, Unary):
-        return f"unary({str(ir.type)})"
-    if isinstance(ir, Condition):
-        return f"condition({encode_var_for_compare(ir.value)})"
-    if isinstance(ir, NewStructure):
-        return "new_structure"
-    if isinstance(ir, NewContract):
-        return "new_contract"
-    if isinstance(ir, NewArray):
-        return f"new_array({ntype(ir.array_type)})"
-    if isinstance(ir, NewElementaryType):
-        return f"new_elementary({ntype(ir.type)})"
-    if isinstance(ir, Delete):
-        return f"delete({encode_var_for_compare(ir.lvalue)},{encode_var_for_compare(ir.variable)})"
-    if isinstance(ir, SolidityCall):
-        return f"solidity_call({ir.function.full_name})"
-    if isinstance(ir, InternalCall):
-        return f"internal_call({ntype(ir.type_call)})"
-    if isinstance(ir, EventCall):  # is this useful?
-        return "event"
-    if isinstance(ir, LibraryCall):
-        return "library_call"
-    if isinstance(ir, InternalDynamicCall):
-        return "internal_dynamic_call"
-    if isinstance(ir, HighLevelCall):  # TODO: improve
-        return "high_level_call"
-    if isinstance(ir, LowLevelCall):  # TODO: improve
-        return "low_level_call"
-    if isinstance(ir, TypeConversion):
-        return f"type_conversion({ntype(ir.type)})"
-    if isinstance(ir, Return):  # this can be improved using values
-        return "return"  # .format(ntype(ir.type))
-    if isinstance(ir, Transfer):
-        return f"transfer({encode_var_for_compare(ir.call_value)})"
-    if isinstance(ir, Send):
-        return f"send({encode_var_for_compare(ir.call_value)})"
-    if isinstance(ir, Unpack):  # TODO: improve
-        return "unpack"
-    if isinstance(ir, InitArray):  # TODO: improve
-        return "init_array"
-
-    # default
-    return ""
+    encoded = _IR_ENCODE_CACHE.get(ir)
+    if encoded is None:
+        # Interned so that comparing two encodings in is_function_modified is usually an identity check
+        encoded = sys.intern(_encode_ir_for_compare(ir))
+        _IR_ENCODE_CACHE[ir] = encoded
+    return encoded
+
+
+# Checked in order, like an isinstance chain: the first matching class wins
+_IR_ENCODERS: List[Tuple[type, Callable[[Any], str]]] = [
+    (
+        Assignment,
+        lambda ir: f"({encode_var_for_compare(ir.lvalue)}):=({encode_var_for_compare(ir.rvalue)})",
+    ),
+    (Index, lambda ir: f"index({ntype(ir.index_type)})"),
+    (Member, lambda ir: "member"),  # .format(ntype(ir._type))
+    (Length, lambda ir: "length"),
+    (
+        Binary,
+        lambda ir: f"binary({str(ir.variable_left)}{str(ir.type)}{str(ir.variable_right)})",
+    ),
+    (Unary, lambda ir: f"unary({str(ir.type)})"),
+    (Condition, lambda ir: f"condition({encode_var_for_compare(ir.value)})"),
+    (NewStructure, lambda ir: "new_structure"),
+    (NewContract, lambda ir: "new_contract"),
+    (NewArray, lambda ir: f"new_array({ntype(ir.array_type)})"),
+    (NewElementaryType, lambda ir: f"new_elementary({ntype(ir.type)})"),
+    (
+        Delete,
+        lambda ir: f"delete({encode_var_for_compare(ir.lvalue)},{encode_var_for_compare(ir.variable)})",
+    ),
+    (SolidityCall, lambda ir: f"solidity_call({ir.function.full_name})"),
+    (InternalCall, lambda ir: f"internal_call({ntype(ir.type_call)})"),
+    (EventCall, lambda ir: "event"),  # is this useful?
+    (LibraryCall, lambda ir: "library_call"),
+    (InternalDynamicCall, lambda ir: "internal_dynamic_call"),
+    (HighLevelCall, lambda ir: "high_level_call"),  # TODO: improve
+    (LowLevelCall, lambda ir: "low_level_call"),  # TODO: improve
+    (TypeConversion, lambda ir: f"type_conversion({ntype(ir.type)})"),
+    (Return, lambda ir: "return"),  # this can be improved using values
+    (Transfer, lambda ir: f"transfer({encode_var_for_compare(ir.call_value)})"),
+    (Send, lambda ir: f"send({encode_var_for_compare(ir.call_value)})"),
+    (Unpack, lambda ir: "unpack"),  # TODO: improve
+    (InitArray, lambda ir: "init_array"),  # TODO: improve
+]
+_IR_ENCODERS_BY_TYPE: Dict[type, Callable[[Any], str]] = {}
+
+
+def _encode_ir_for_compare(ir: Operation) -> str:
+    encoder = _IR_ENCODERS_BY_TYPE.get(type(ir))
+    if encoder is None:
+        encoder = _find_encoder(type(ir), _IR_ENCODERS)
+        _IR_ENCODERS_BY_TYPE[type(ir)] = encoder
+    return encoder(ir)
+
+
+# Checked in order, like an isinstance chain: the first matching class wins
+_VAR_ENCODERS: List[Tuple[type, Callable[[Any], str]]] = [
+    (Constant, lambda var: f"constant({ntype(var.type)})"),
+    (SolidityVariableComposed, lambda var: f"solidity_variable_composed({var.name})"),
+    (SolidityVariable, lambda var: f"solidity_variable{var.name}"),
+    (TemporaryVariable, lambda var: "temporary_variable"),
+    (ReferenceVariable, lambda var: f"reference({ntype(var.type)})"),
+    (LocalVariable, lambda var: f"local_solc_variable({var.location})"),
+    (StateVariable, lambda var: f"state_solc_variable({ntype(var.type)})"),
+    (LocalVariableInitFromTuple, lambda var: "local_variable_init_tuple"),
+    (TupleVariable, lambda var: "tuple_variable"),
+]
+_VAR_ENCODERS_BY_TYPE: Dict[type, Callable[[Any], str]] = {}
 
 
-# pylint: disable=too-many-branches
 def encode_var_for_compare(var: Variable) -> str:
-
-    # variables
-    if isinstance(var, Constant):
-        return f"constant({ntype(var.type)})"
-    if isinstance(var, SolidityVariableComposed):
-        return f"solidity_variable_composed({var.name})"
-    if isinstance(var, SolidityVariable):
-        return f"solidity_variable{var.name}"
-    if isinstance(var, TemporaryVariable):
-        return "temporary_variable"
-    if isinstance(var, ReferenceVariable):
-        return f"reference({ntype(var.type)})"
-    if isinstance(var, LocalVariable):
-        return f"local_solc_variable({var.location})"
-    if isinstance(var, StateVariable):
-        return f"state_solc_variable({ntype(var.type)})"
-    if isinstance(var, LocalVariableInitFromTuple):
-        return "local_variable_init_tuple"
-    if isinstance(var, TupleVariable):
-        return "tuple_variable"
-
-    # default
-    return ""
+    encoder = _VAR_ENCODERS_BY_TYPE.get(type(var))
+    if encoder is None:
+        encoder = _find_encoder(type(var), _VAR_ENCODERS)
+        _VAR_ENCODERS_BY_TYPE[type(var)] = encoder
+    return encoder(var)
 
 
 def get_proxy_implementation_slot(proxy: Contract) -> Optional[SlotInfo]:
@@ -361,7 +552,12 @@ def get_proxy_implementation_slot(proxy: Contract) -> Optional[SlotInfo]:
     Returns:
         (`SlotInfo`) | None : A dictionary of the slot information.
     """
+    if proxy not in _PROXY_SLOT_CACHE:
+        _PROXY_SLOT_CACHE[proxy] = _get_proxy_implementation_slot(proxy)
+    return _PROXY_SLOT_CACHE[proxy]
+
 
+def _get_proxy_implementation_slot(proxy: Contract) -> Optional[SlotInfo]:
     delegate = get_proxy_implementation_var(proxy)
     if isinstance(delegate, StateVariable):
         if not delegate.is_constant and not delegate.is_immutable:
@@ -389,6 +585,12 @@ def get_proxy_implementation_var(proxy: Contract) -> Optional[Variable]:
     Returns:
         (`Variable`) | None : The variable, ideally a StateVariable, which stores the proxy's implementation address.
     """
+    if proxy not in _PROXY_VAR_CACHE:
+        _PROXY_VAR_CACHE[proxy] = _get_proxy_implementation_var(proxy)
+    return _PROXY_VAR_CACHE[proxy]
+
+
+def _get_proxy_implementation_var(proxy: Contract) -> Optional[Variable]:
     if not proxy.is_upgradeable_proxy or not proxy.fallback_function:
         return None
 
@@ -465,26 +667,21 @@ def extract_delegate_from_asm(contract: Contract, node: Node) -> Optional[Variab
     Returns:
         (`Variable`) | None : The variable being passed as the destination argument in a delegatecall in the fallback.
     """
-    asm_split = str(node.inline_asm).split("\n")
-    asm = next(line for line in asm_split if "delegatecall" in line)
-    params = asm.split("call(")[1].split(", ")
+    # Only the line with the delegatecall matters, so slice it out instead of splitting the whole block
+    asm = str(node.inline_asm)
+    call_idx = asm.index("delegatecall")
+    line_end = asm.find("\n", call_idx)
+    line = asm[asm.rfind("\n", 0, call_idx) + 1 : line_end if line_end != -1 else len(asm)]
+    params = line.split("call(")[1].split(", ")
     dest = params[1]
     if dest.endswith(")") and not dest.startswith("sload("):
         dest = params[2]
     if dest.startswith("sload("):
-        dest = dest.replace(")", "(").split("(")[1]
+        dest = _SLOAD_ARG_RE.match(dest).group(1)
         if dest.startswith("0x"):
             return create_state_variable_from_slot(dest)
         if dest.isnumeric():
-            slot_idx = int(dest)
-            return next(
-                (
-                    v
-                    for v in contract.state_variables_ordered
-                    if SlitherReadStorage.get_variable_info(contract, v)[0] == slot_idx
-                ),
-                None,
-            )
+            return _get_state_variables_by_slot(contract).get(int(dest))
         for v in node.function.variables_read_or_written:
             if v.name == dest:
                 if isinstance(v, LocalVariable) and v.expression is not None:
@@ -524,35 +721,58 @@ def find_delegate_from_name(
         if pv.name == dest:
             return pv
     if parent_func.contains_assembly:
-        for node in parent_func.all_nodes():
-            if node.type == NodeType.ASSEMBLY and isinstance(node.inline_asm, str):
-                asm = next(
-                    (
-                        s
-                        for s in node.inline_asm.split("\n")
-                        if f"{dest}:=sload(" in s.replace(" ", "")
-                    ),
-                    None,
-                )
-                if asm:
-                    slot = asm.split("sload(")[1].split(")")[0]
-                    if slot.startswith("0x"):
-                        return create_state_variable_from_slot(slot, name=dest)
-                    try:
-                        slot_idx = int(slot)
-                        return next(
-                            (
-                                v
-                                for v in contract.state_variables_ordered
-                                if SlitherReadStorage.get_variable_info(contract, v)[0] == slot_idx
-                            ),
-                            None,
-                        )
-                    except TypeError:
-                        continue
+        slot = _get_asm_sload_slots(parent_func).get(dest)
+        if slot:
+            if slot.startswith("0x"):
+                return create_state_variable_from_slot(slot, name=dest)
+            try:
+                return _get_state_variables_by_slot(contract).get(int(slot))
+            except ValueError:
+                return None
     return None
 
 
+def _get_asm_sload_slots(function: Function) -> Dict[str, str]:
+    """
+    Maps every name assigned from an `sload` in the function's assembly blocks to the slot it loads,
+    keeping the first assignment found. The result is cached per function.
+    Args:
+        function: The Function object to search.
+
+    Returns:
+        Dict mapping variable names to storage slot strings
+    """
+    if function not in _ASM_SLOAD_SLOTS_CACHE:
+        slots: Dict[str, str] = {}
+        for node in function.all_nodes():
+            if node.type == NodeType.ASSEMBLY and isinstance(node.inline_asm, str):
+                for name, slot in _ASM_SLOAD_ASSIGNMENT_RE.findall(node.inline_asm):
+                    slots.setdefault(name, slot)
+        _ASM_SLOAD_SLOTS_CACHE[function] = slots
+    return _ASM_SLOAD_SLOTS_CACHE[function]
+
+
+def _get_state_variables_by_slot(contract: Contract) -> Dict[int, StateVariable]:
+    """
+    Maps each storage slot used by the contract to the first StateVariable stored in it.
+    The result is cached per contract.
+    Args:
+        contract: The Contract object, which must have a storage layout (i.e., be a derived contract).
+
+    Returns:
+        Dict mapping slot indexes to StateVariables
+    """
+    if contract not in _STATE_VARIABLES_BY_SLOT_CACHE:
+        variables: Dict[int, StateVariable] = {}
+        for v in contract.state_variables_ordered:
+            # Constant and immutable variables are not stored, so they have no slot
+            if not v.is_constant and not v.is_immutable:
+                slot, _ = contract.compilation_unit.storage_layout_of(contract, v)
+                variables.setdefault(slot, v)
+        _STATE_VARIABLES_BY_SLOT_CACHE[contract] = variables
+    return _STATE_VARIABLES_BY_SLOT_CACHE[contract]
+
+
 def create_state_variable_from_slot(slot: str, name: str = None) -> Optional[StateVariable]:
     """
     Creates a new StateVariable object to wrap a hardcoded storage slot found in assembly.
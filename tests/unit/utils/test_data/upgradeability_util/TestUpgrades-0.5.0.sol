@@ -4,3 +4,5 @@ import "./src/EIP1822Proxy.sol";
 import "./src/ZosProxy.sol";
 import "./src/MasterCopyProxy.sol";
 import "./src/SynthProxy.sol";
+import "./src/SlotNameProxy.sol";
+import "./src/PackedSlotProxy.sol";
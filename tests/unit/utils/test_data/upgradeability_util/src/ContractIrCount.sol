@@ -0,0 +1,27 @@
+pragma solidity ^0.8.2;
+
+contract IrCountV1 {
+    uint private stateA = 0;
+    uint private stateB = 0;
+
+    function set(uint x) public {
+        stateA = x;
+    }
+}
+
+contract IrCountV2 {
+    uint private stateA = 0;
+    uint private stateB = 0;
+
+    function set(uint x) public {
+        stateB = stateA = x;
+    }
+}
+
+interface IIrCountV1 {
+    function k(uint a) external;
+}
+
+interface IIrCountV2 {
+    function k(uint b) external;
+}
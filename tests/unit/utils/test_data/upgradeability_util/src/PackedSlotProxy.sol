@@ -0,0 +1,58 @@
+pragma solidity ^0.5.0;
+
+contract PackedSlotProxy {
+    uint256 internal constant VERSION = 1;
+    address internal implementation;
+    bool internal initialized;
+
+    constructor(address _implementation)
+        public
+    {
+        implementation = _implementation;
+        initialized = true;
+    }
+
+    function ()
+        external
+        payable
+    {
+        // The constant takes no slot, and initialized is packed after implementation in slot 0
+        assembly {
+            calldatacopy(0, 0, calldatasize())
+            let success := delegatecall(gas, sload(0), 0, calldatasize(), 0, 0)
+            returndatacopy(0, 0, returndatasize())
+            if eq(success, 0) { revert(0, returndatasize()) }
+            return(0, returndatasize())
+        }
+    }
+}
+
+contract PackedSlotNameProxy {
+    uint256 internal constant VERSION = 1;
+    uint128 internal lower;
+    uint128 internal upper;
+    address internal implementation;
+    bool internal initialized;
+
+    constructor(address _implementation)
+        public
+    {
+        implementation = _implementation;
+        initialized = true;
+    }
+
+    function ()
+        external
+        payable
+    {
+        // lower and upper share slot 0, implementation and initialized share slot 1
+        assembly {
+            let impl := sload(1)
+            calldatacopy(0, 0, calldatasize())
+            let success := delegatecall(gas, impl, 0, calldatasize(), 0, 0)
+            returndatacopy(0, 0, returndatasize())
+            if eq(success, 0) { revert(0, returndatasize()) }
+            return(0, returndatasize())
+        }
+    }
+}
@@ -0,0 +1,55 @@
+pragma solidity ^0.5.0;
+
+contract SlotNameProxy {
+    address internal implementation;
+
+    constructor(address _implementation)
+        public
+    {
+        implementation = _implementation;
+    }
+
+    function ()
+        external
+        payable
+    {
+        // The slot is only known at runtime, so it cannot be resolved to a variable
+        assembly {
+            let implSlot := 0
+            let impl := sload(implSlot)
+            calldatacopy(0, 0, calldatasize())
+            let success := delegatecall(gas, impl, 0, calldatasize(), 0, 0)
+            returndatacopy(0, 0, returndatasize())
+            if eq(success, 0) { revert(0, returndatasize()) }
+            return(0, returndatasize())
+        }
+    }
+}
+
+contract ShadowedSlotNameProxy {
+    address internal admin;
+    address internal implementation;
+
+    constructor(address _implementation)
+        public
+    {
+        admin = msg.sender;
+        implementation = _implementation;
+    }
+
+    function ()
+        external
+        payable
+    {
+        // Only the exact name passed to delegatecall must be matched, not names ending with it
+        assembly {
+            let oldimpl := sload(0)
+            let impl := sload(1)
+            calldatacopy(0, 0, calldatasize())
+            let success := delegatecall(gas, impl, 0, calldatasize(), 0, 0)
+            returndatacopy(0, 0, returndatasize())
+            if eq(success, 0) { revert(0, returndatasize()) }
+            return(0, returndatasize())
+        }
+    }
+}
@@ -5,6 +5,7 @@ from slither import Slither
 from slither.core.expressions import Literal
 from slither.utils.upgradeability import (
     compare,
+    compare_many,
     get_proxy_implementation_var,
     get_proxy_implementation_slot,
 )
@@ -13,7 +14,7 @@ SLITHER_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 TEST_DATA_DIR = Path(__file__).resolve().parent / "test_data" / "upgradeability_util"
 
 
-# pylint: disable=too-many-locals
+# pylint: disable=too-many-locals,too-many-statements
 def test_upgrades_compare(solc_binary_path) -> None:
     solc_path = solc_binary_path("0.8.2")
 
@@ -35,6 +36,35 @@ def test_upgrades_compare(solc_binary_path) -> None:
     ]
 
 
+def test_upgrades_compare_ir_count(solc_binary_path) -> None:
+    solc_path = solc_binary_path("0.8.2")
+
+    sl = Slither(os.path.join(TEST_DATA_DIR, "TestUpgrades-0.8.2.sol"), solc=solc_path)
+    c1 = sl.get_contract_from_name("IrCountV1")[0]
+    c2 = sl.get_contract_from_name("IrCountV2")[0]
+    # Same CFG shape, but c2's node has one more IR than c1's
+    modified_funcs = compare(c1, c2)[4]
+    assert modified_funcs == [c2.get_function_from_signature("set(uint256)")]
+    modified_funcs = compare(c2, c1)[4]
+    assert modified_funcs == [c1.get_function_from_signature("set(uint256)")]
+
+    # Functions without a body have different hashes but no CFG to compare
+    i1 = sl.get_contract_from_name("IIrCountV1")[0]
+    i2 = sl.get_contract_from_name("IIrCountV2")[0]
+    modified_funcs = compare(i1, i2)[4]
+    assert len(modified_funcs) == 0
+
+
+def test_upgrades_compare_many(solc_binary_path) -> None:
+    solc_path = solc_binary_path("0.8.2")
+
+    sl = Slither(os.path.join(TEST_DATA_DIR, "TestUpgrades-0.8.2.sol"), solc=solc_path)
+    v1 = sl.get_contract_from_name("ContractV1")[0]
+    v2 = sl.get_contract_from_name("ContractV2")[0]
+    pairs = [(v1, v2), (v2, v1), (v1, v1)]
+    assert compare_many(pairs) == [compare(c1, c2) for c1, c2 in pairs]
+
+
 def test_upgrades_implementation_var(solc_binary_path) -> None:
     solc_path = solc_binary_path("0.8.2")
     sl = Slither(os.path.join(TEST_DATA_DIR, "TestUpgrades-0.8.2.sol"), solc=solc_path)
@@ -58,6 +88,10 @@ def test_upgrades_implementation_var(solc_binary_path) -> None:
     # zos_proxy = sl.get_contract_from_name("ZosProxy")[0]
     master_copy_proxy = sl.get_contract_from_name("MasterCopyProxy")[0]
     synth_proxy = sl.get_contract_from_name("SynthProxy")[0]
+    slot_name_proxy = sl.get_contract_from_name("SlotNameProxy")[0]
+    shadowed_slot_name_proxy = sl.get_contract_from_name("ShadowedSlotNameProxy")[0]
+    packed_slot_proxy = sl.get_contract_from_name("PackedSlotProxy")[0]
+    packed_slot_name_proxy = sl.get_contract_from_name("PackedSlotNameProxy")[0]
 
     target = get_proxy_implementation_var(eip_1822_proxy)
     slot = get_proxy_implementation_slot(eip_1822_proxy)
@@ -81,3 +115,21 @@ def test_upgrades_implementation_var(solc_binary_path) -> None:
     slot = get_proxy_implementation_slot(synth_proxy)
     assert target == synth_proxy.get_state_variable_from_name("target")
     assert slot.slot == 1
+    # The slot passed to sload is not a number, so there is no variable to resolve it to
+    target = get_proxy_implementation_var(slot_name_proxy)
+    slot = get_proxy_implementation_slot(slot_name_proxy)
+    assert target is None
+    assert slot is None
+    target = get_proxy_implementation_var(shadowed_slot_name_proxy)
+    slot = get_proxy_implementation_slot(shadowed_slot_name_proxy)
+    assert target == shadowed_slot_name_proxy.get_state_variable_from_name("implementation")
+    assert slot.slot == 1
+    # A numeric slot resolves to the first stored variable in it, skipping constants
+    target = get_proxy_implementation_var(packed_slot_proxy)
+    slot = get_proxy_implementation_slot(packed_slot_proxy)
+    assert target == packed_slot_proxy.get_state_variable_from_name("implementation")
+    assert slot.slot == 0
+    target = get_proxy_implementation_var(packed_slot_name_proxy)
+    slot = get_proxy_implementation_slot(packed_slot_name_proxy)
+    assert target == packed_slot_name_proxy.get_state_variable_from_name("implementation")
+    assert slot.slot == 1